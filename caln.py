@@ -1,7 +1,12 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog, Menu, filedialog
 from datetime import date, timedelta, datetime
-import json, os, sys
+import functools, json, mmap, os, sys, zipfile
+
+try:
+    import orjson  # optional, much faster encode/decode
+except ImportError:
+    orjson = None
 
 # =========================================================
 # CONFIGURATION
@@ -11,7 +16,15 @@ APP_DIR = (
     if getattr(sys, "frozen", False)
     else os.path.dirname(os.path.abspath(__file__))
 )
-DIARY_FILE = os.path.join(APP_DIR, "calnlogs.json")
+DIARY_FILE = os.path.join(APP_DIR, "calnlogs.jsonl")
+LEGACY_DIARY_FILE = os.path.join(APP_DIR, "calnlogs.json")
+SAVE_DELAY_MS = 1500
+COMPACT_RATIO = 4
+EXPORT_ARCHIVE = "calnlogs_export.zip"
+EXPORT_NAME_TRANS = str.maketrans({":": "-", "/": "-", "\\": "-"})
+
+DATE_FORMAT = "%Y-%m-%d"
+LABEL_FORMAT = "%Y.%m.%d"
 
 BASE_FONT = "SF Mono"
 FONT_SIZES = {"small": 9, "medium": 11, "large": 13}
@@ -21,6 +34,7 @@ FONT_SIZES = {"small": 9, "medium": 11, "large": 13}
 # =========================================================
 def run_ui_with_error_handling(func):
     """Decorator to catch UI errors and show pop-up messages."""
+    @functools.wraps(func)
     def wrapper(*a, **kw):
         try:
             return func(*a, **kw)
@@ -28,52 +42,203 @@ def run_ui_with_error_handling(func):
             messagebox.showerror("Error", str(e))
     return wrapper
 
-class DateUtils:
-    """Utility functions for date parsing and formatting."""
-    @staticmethod
-    def format(d):
-        return d.strftime("%Y-%m-%d")
+def json_dumps(obj):
+    """Compact UTF-8 encoded JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
-    @staticmethod
-    def parse(s):
-        try:
-            return datetime.strptime(s, "%Y-%m-%d").date()
-        except ValueError:
-            return None
+def json_loads(s):
+    return orjson.loads(s) if orjson else json.loads(s)
+
+def format_date(d):
+    return d.isoformat()  # same as DATE_FORMAT, without format parsing
+
+@functools.lru_cache(maxsize=1024)
+def format_label(d):
+    return d.strftime(LABEL_FORMAT)
+
+def parse_date(s):
+    try:
+        return datetime.strptime(s, DATE_FORMAT).date()
+    except ValueError:
+        return None
 
 # =========================================================
 # DATA MANAGER
 # =========================================================
 class DiaryDataManager:
-    """Handles loading, saving, and managing diary notes."""
-    def __init__(self, path):
+    """Handles loading, saving, and managing diary notes.
+
+    Notes are kept in an append-only JSONL journal: every change adds one
+    {"d": date, "c": content} line and an empty content marks a deletion.
+    Startup only indexes where each date's latest line lives in the
+    (memory-mapped) journal; note text is decoded on first access. The
+    journal is compacted once it grows well past the live note count.
+    """
+    def __init__(self, path, legacy_path=None):
         self.path = path
-        self.data = self.load()
+        self._fp = None
+        self._mm = None
+        self._size = 0
+        self._records = 0
+        self._torn = False
+        self._index = {}  # date -> (offset, length) of its line on disk
+        self._notes = {}  # decoded notes; edited ones exist only here
+        migrate = not os.path.exists(self.path) and legacy_path and os.path.exists(legacy_path)
+        self.load()
+        self._dirty = False
+        if migrate:
+            self._notes = self._load_legacy(legacy_path)
+            self.compact()
+            os.replace(legacy_path, legacy_path + ".migrated")
+        elif self._torn:
+            self.compact()
+        self._fp = open(self.path, "ab", buffering=8192)
 
     def load(self):
         if not os.path.exists(self.path):
-            return {}
+            return
+        offset = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                self._index_line(line, offset)
+                offset += len(line)
+        self._size = offset
+        self._map()
+
+    def _index_line(self, line, offset):
+        # Lines we wrote ourselves are recognised without a full parse.
+        if line.startswith(b'{"d":"') and line.endswith(b"\n"):
+            date_str = line[6:line.index(b'"', 6)].decode("utf-8")
+            deleted = line.endswith(b',"c":""}\n')
+        else:
+            try:
+                rec = json_loads(line)
+                date_str, deleted = rec["d"], not rec["c"]
+            except (ValueError, KeyError, TypeError):
+                self._torn = True  # interrupted write or foreign line, dropped on compact
+                return
+            self._torn = self._torn or not line.endswith(b"\n")
+        self._records += 1
+        if deleted:
+            self._index.pop(date_str, None)
+        else:
+            self._index[date_str] = (offset, len(line))
+
+    def _map(self):
+        if self._mm:
+            self._mm.close()
+            self._mm = None
+        if self._size:
+            with open(self.path, "rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _load_legacy(self, path):
         try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(path, "r", encoding="utf-8") as f:
+                return {k: v for k, v in json_loads(f.read()).items() if v}
         except Exception:
             return {}
 
     def save(self):
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2)
+        self._fp.flush()
+        if self._records > COMPACT_RATIO * max(len(self.dates()), 1):
+            self.compact()
+        self._dirty = False
+
+    def compact(self):
+        """Atomically rewrite the journal with one line per live note."""
+        tmp = self.path + ".tmp"
+        index, offset = {}, 0
+        with open(tmp, "wb", buffering=65536) as f:
+            for date_str in self.dates():
+                loc = self._index.get(date_str)
+                if loc:
+                    line = self._mm[loc[0]:loc[0] + loc[1]]
+                    if not line.endswith(b"\n"):  # unterminated tail of a torn journal
+                        line += b"\n"
+                else:
+                    line = self._encode(date_str, self._notes[date_str])
+                f.write(line)
+                index[date_str] = (offset, len(line))
+                offset += len(line)
+            f.flush()
+            os.fsync(f.fileno())
+        reopen = self._fp is not None
+        if reopen:
+            self._fp.close()
+        if self._mm:
+            self._mm.close()
+            self._mm = None
+        try:
+            os.replace(tmp, self.path)
+            self._index, self._notes = index, {}
+            self._records, self._size, self._torn = len(index), offset, False
+        finally:
+            # if the replace failed this maps the untouched journal again
+            self._map()
+            if reopen:
+                self._fp = open(self.path, "ab", buffering=8192)
+
+    def flush(self):
+        """Write to disk only if notes changed since the last save."""
+        if self._dirty:
+            self.save()
+
+    def close(self):
+        self.flush()
+        self._fp.close()
+        if self._mm:
+            self._mm.close()
+
+    @staticmethod
+    def _encode(date_str, content):
+        return json_dumps({"d": date_str, "c": content}) + b"\n"
+
+    def _append(self, date_str, content):
+        self._fp.write(self._encode(date_str, content))
+        self._records += 1
+        self._dirty = True
+
+    def _read(self, date_str):
+        off, length = self._index[date_str]
+        return json_loads(self._mm[off:off + length])["c"]
+
+    def dates(self):
+        return sorted(self._index.keys() | self._notes.keys())
+
+    def items(self):
+        """Yield (date, note) for every note without caching the text."""
+        for date_str in self.dates():
+            note = self._notes.get(date_str)
+            yield date_str, note if note is not None else self._read(date_str)
 
     def get(self, date_str):
-        return self.data.get(date_str, "")
+        note = self._notes.get(date_str)
+        if note is None:
+            if date_str not in self._index:
+                return ""
+            note = self._notes[date_str] = self._read(date_str)
+        return note
 
     def set(self, date_str, content):
-        if content:
-            self.data[date_str] = content
-        else:
-            self.data.pop(date_str, None)
+        """Store a note; returns False if it was already up to date."""
+        if not content:
+            return self.clear(date_str)
+        if self.get(date_str) == content:
+            return False
+        self._notes[date_str] = content
+        self._index.pop(date_str, None)
+        self._append(date_str, content)
+        return True
 
     def clear(self, date_str):
-        self.data.pop(date_str, None)
+        in_index = self._index.pop(date_str, None) is not None
+        if self._notes.pop(date_str, None) is None and not in_index:
+            return False
+        self._append(date_str, "")
+        return True
 
 # =========================================================
 # USER INTERFACE
@@ -84,11 +249,11 @@ class DiaryUI(tk.Tk):
         self.title("CalN")
 
         # Core Components
-        self.data_mgr = DiaryDataManager(DIARY_FILE)
-        self.date_utils = DateUtils()
+        self.data_mgr = DiaryDataManager(DIARY_FILE, LEGACY_DIARY_FILE)
         self.font_size = FONT_SIZES["medium"]
-        self.selected_date = date.today()
-        self.selected_date_str = self.date_utils.format(self.selected_date)
+        self.selected_date = None
+        self.selected_date_str = ""
+        self._save_job = None
 
         # Launch Maximized with Title Bar
         self._maximize_window()
@@ -101,7 +266,7 @@ class DiaryUI(tk.Tk):
         
         self._setup_ui()
         self._create_context_menu()
-        self._select_date(self.selected_date)
+        self._select_date(date.today())
 
         # Exit Handling
         self.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -130,6 +295,7 @@ class DiaryUI(tk.Tk):
         self.text_area = tk.Text(self, wrap="word",
                                  font=(BASE_FONT, self.font_size))
         self.text_area.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
+        self.text_area.edit_modified(False)
         self.text_area.bind("<FocusOut>", lambda e: self.save_note())
         self.text_area.bind("<Button-3>", self._show_context_menu)
 
@@ -157,16 +323,18 @@ class DiaryUI(tk.Tk):
     # -----------------------------------------------------
     @run_ui_with_error_handling
     def _select_date(self, dt):
+        if dt == self.selected_date:
+            return
         self.selected_date = dt
-        self.selected_date_str = self.date_utils.format(dt)
-        self.current_date_label.config(text=dt.strftime("%Y.%m.%d"))
+        self.selected_date_str = format_date(dt)
+        self.current_date_label.config(text=format_label(dt))
         note = self.data_mgr.get(self.selected_date_str)
-        self.text_area.delete("1.0", tk.END)
-        if note:
-            self.text_area.insert("1.0", note)
+        self.text_area.replace("1.0", tk.END, note)
+        self.text_area.edit_modified(False)
 
     def _save_and_select(self, new_date):
         self.save_note()
+        self.flush_notes()
         self._select_date(new_date)
 
     def prev_day(self):
@@ -183,20 +351,37 @@ class DiaryUI(tk.Tk):
     # -----------------------------------------------------
     @run_ui_with_error_handling
     def save_note(self, event=None):
+        # Tk's modified flag is cheap; skip fetching the buffer if unedited.
+        if not self.text_area.edit_modified():
+            return
         content = self.text_area.get("1.0", tk.END)
         clean_content = content.strip()
         final_content = clean_content + "\n" if clean_content else ""
-        if self.data_mgr.get(self.selected_date_str) != final_content:
-            self.data_mgr.set(self.selected_date_str, final_content)
-            self.data_mgr.save()
+        if self.data_mgr.set(self.selected_date_str, final_content):
+            self._schedule_flush()
+        self.text_area.edit_modified(False)
+
+    def _schedule_flush(self):
+        """Coalesce rapid edits into a single disk write."""
+        if self._save_job:
+            self.after_cancel(self._save_job)
+        self._save_job = self.after(SAVE_DELAY_MS, self.flush_notes)
+
+    @run_ui_with_error_handling
+    def flush_notes(self):
+        if self._save_job:
+            self.after_cancel(self._save_job)
+            self._save_job = None
+        self.data_mgr.flush()
 
     @run_ui_with_error_handling
     def clear_note(self):
         if messagebox.askyesno("Confirm Clear",
                                 f"Clear notes for {self.selected_date_str}?"):
             self.data_mgr.clear(self.selected_date_str)
-            self.data_mgr.save()
+            self.flush_notes()
             self.text_area.delete("1.0", tk.END)
+            self.text_area.edit_modified(False)
 
     @run_ui_with_error_handling
     def goto_date(self):
@@ -206,7 +391,7 @@ class DiaryUI(tk.Tk):
         )
         if not date_str:
             return
-        dt = self.date_utils.parse(date_str.strip())
+        dt = parse_date(date_str.strip())
         if dt:
             self._save_and_select(dt)
         else:
@@ -218,16 +403,17 @@ class DiaryUI(tk.Tk):
         folder = filedialog.askdirectory(title="Select Folder to Export Notes")
         if not folder:
             return
+        archive = os.path.join(folder, EXPORT_ARCHIVE)
         try:
-            for date_str, note in self.data_mgr.data.items():
-                clean_note = note.strip()
-                export_content = clean_note + "\n" if clean_note else ""
-                filename = f"{date_str.replace(':', '-')}.txt"
-                path = os.path.join(folder, filename)
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(export_content)
+            with open(archive, "wb", buffering=1 << 16) as f, \
+                    zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as zf:
+                for date_str, note in self.data_mgr.items():
+                    clean_note = note.strip()
+                    export_content = clean_note + "\n" if clean_note else ""
+                    filename = f"{date_str.translate(EXPORT_NAME_TRANS)}.txt"
+                    zf.writestr(filename, export_content.encode("utf-8"))
             messagebox.showinfo("Export Complete",
-                                f"Notes exported to:\n{folder}")
+                                f"Notes exported to:\n{archive}")
         except Exception as e:
             messagebox.showerror("Export Failed", str(e))
 
@@ -236,7 +422,11 @@ class DiaryUI(tk.Tk):
     # -----------------------------------------------------
     def on_close(self):
         self.save_note()
-        self.destroy()
+        self.flush_notes()
+        try:
+            self.data_mgr.close()
+        finally:
+            self.destroy()
 
 # =========================================================
 # MAIN ENTRY
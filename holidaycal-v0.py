@@ -3,14 +3,27 @@
 import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 import pygame
-import datetime
+import calendar
+import functools
+
+@functools.lru_cache(maxsize=32)
+def cal_tile(pygame, tile_w, tile_h, colour):
+    tile = pygame.Surface((tile_w, tile_h))
+    tile.fill(colour)
+    return tile
+
 
 def cal_show_background(pygame, display_window, width, height, block_size_w, block_size_h, colour):
-    pygame.draw.rect(display_window, colour, [width, height, block_size_w - 4, block_size_h - 4])
+    display_window.blit(cal_tile(pygame, block_size_w - 4, block_size_h - 4, colour), (width, height))
+
+
+@functools.lru_cache(maxsize=512)
+def cal_render_text(font_style, msg, colour):
+    return font_style.render(msg, True, colour)
 
 
 def cal_show_message(display_window, font_style, msg, colour, width, height):
-    message = font_style.render(msg, True, colour)
+    message = cal_render_text(font_style, msg, colour)
     display_window.blit(message, [width, height])
 
 
@@ -19,8 +32,10 @@ def cal_release(pygame):
 
 
 def find_year_start_day(year):
-    day = datetime.datetime.strptime(str(year) + '.01.01', '%Y.%m.%d')
-    return ((day.isoweekday() % 7) + 1)         # sun: 1, mon: 2, ... Sat: 7
+    # Sakamoto's method for Jan 1 (month offset 0), 0 = Sunday
+    y = year - 1
+    dow = (y + y // 4 - y // 100 + y // 400 + 1) % 7
+    return dow + 1                              # sun: 1, mon: 2, ... Sat: 7
 
 
 def calc_month_days(month_num_days, start_day):
@@ -50,15 +65,7 @@ def calc_holiday_in():
                     [1, 2, 20, 22], [      ], [25, 26, 29, 30, 31]   # oct, nov, dec
     ]
 
-    holiday_str = []
-    for mh in holiday_in:
-        mon_list_str = []
-        for d in mh:
-            tmp_str = '{:3d}'.format(d)
-            mon_list_str.append(tmp_str)
-        holiday_str.append(mon_list_str)
-
-    return holiday_str
+    return [{'{:3d}'.format(d) for d in mh} for mh in holiday_in]
 
 
 def calc_holiday_jp():
@@ -68,14 +75,7 @@ def calc_holiday_jp():
                     [13          ], [3, 24     ], [30, 31]   # oct, nov, dec
     ]
 
-    holiday_str = []
-    for mh in holiday_jp:
-        mon_list_str = []
-        for d in mh:
-            tmp_str = '{:3d}'.format(d)
-            mon_list_str.append(tmp_str)
-        holiday_str.append(mon_list_str)
-    return holiday_str
+    return [{'{:3d}'.format(d) for d in mh} for mh in holiday_jp]
 
 
 def calc_weekdays():
@@ -149,34 +149,18 @@ def show_calendar():
     display_window = pygame.display.set_mode((WIDTH, HEIGHT))
     display_window.fill(colours[CLR_WHITE])
 
-    clock = pygame.time.Clock()
-
     days = ['Su', 'Mo', 'Tu', 'We', 'Th', 'Fr', 'Sa']
     month_start_day = find_year_start_day(CAL_YEAR)
 
-    (month_start_day, jan_dates) = calc_month_days(31, month_start_day)
-    (month_start_day, feb_dates) = calc_month_days(29 if ((CAL_YEAR % 4) == 0) else 28, month_start_day)
-    (month_start_day, mar_dates) = calc_month_days(31, month_start_day)
-
-    (month_start_day, apr_dates) = calc_month_days(30, month_start_day)
-    (month_start_day, may_dates) = calc_month_days(31, month_start_day)
-    (month_start_day, jun_dates) = calc_month_days(30, month_start_day)
-
-    (month_start_day, jul_dates) = calc_month_days(31, month_start_day)
-    (month_start_day, aug_dates) = calc_month_days(31, month_start_day)
-    (month_start_day, sep_dates) = calc_month_days(30, month_start_day)
-
-    (month_start_day, oct_dates) = calc_month_days(31, month_start_day)
-    (month_start_day, nov_dates) = calc_month_days(30, month_start_day)
-    (month_start_day, dec_dates) = calc_month_days(31, month_start_day)
-
+    year_dates = []
+    for month in range(1, 13):
+        month_num_days = calendar.monthrange(CAL_YEAR, month)[1]
+        (month_start_day, month_dates) = calc_month_days(month_num_days, month_start_day)
+        year_dates.append(month_dates)
 
     month_names = [ 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
-    year_dates = [jan_dates, feb_dates, mar_dates, apr_dates, may_dates, jun_dates,
-                  jul_dates, aug_dates, sep_dates, oct_dates, nov_dates, dec_dates]
-
     holiday_in = calc_holiday_in()
     holiday_jp = calc_holiday_jp()
 
@@ -205,55 +189,24 @@ def show_calendar():
         m1 = month + 0
         m2 = month + 1
         m3 = month + 2
-        m1_inhol_len = len(holiday_in[m1])
-        m2_inhol_len = len(holiday_in[m2])
-        m3_inhol_len = len(holiday_in[m3])
-        m1_inhol_num = 0
-        m2_inhol_num = 0
-        m3_inhol_num = 0
-
-        m1_jphol_len = len(holiday_jp[m1])
-        m2_jphol_len = len(holiday_jp[m2])
-        m3_jphol_len = len(holiday_jp[m3])
-        m1_jphol_num = 0
-        m2_jphol_num = 0
-        m3_jphol_num = 0
-
         for idx in range(len(year_dates[0])):
             m1_colour = CLR_WHITE
             m2_colour = CLR_WHITE
             m3_colour = CLR_WHITE
 
-            if m1_inhol_len > 0 and m1_inhol_num < m1_inhol_len:
-                if holiday_in[m1][m1_inhol_num] == year_dates[m1][idx]:
-                    m1_colour = CLR_ORANGE
-                    m1_inhol_num += 1
-
-            if m2_inhol_len > 0 and m2_inhol_num < m2_inhol_len:
-                if holiday_in[m2][m1_inhol_num] == year_dates[m2][idx]:
-                    m2_colour = CLR_ORANGE
-                    m2_inhol_num += 1
-
-            if m3_inhol_len > 0 and m3_inhol_num < m3_inhol_len:
-                if holiday_in[m3][m3_inhol_num] == year_dates[m3][idx]:
-                    m3_colour = CLR_ORANGE
-                    m3_inhol_num += 1
+            if year_dates[m1][idx] in holiday_in[m1]:
+                m1_colour = CLR_ORANGE
+            if year_dates[m2][idx] in holiday_in[m2]:
+                m2_colour = CLR_ORANGE
+            if year_dates[m3][idx] in holiday_in[m3]:
+                m3_colour = CLR_ORANGE
 
-
-            if m1_jphol_len > 0 and m1_jphol_num < m1_jphol_len:
-                if (holiday_jp[m1][m1_jphol_num] == year_dates[m1][idx]):
-                    m1_colour = CLR_YELLOW if m1_colour == CLR_ORANGE else CLR_BLUE
-                    m1_jphol_num += 1
-
-            if m2_jphol_len > 0 and m2_jphol_num < m2_jphol_len:
-                if (holiday_jp[m2][m2_jphol_num] == year_dates[m2][idx]):
-                    m2_colour = CLR_YELLOW if m2_colour == CLR_ORANGE else CLR_BLUE
-                    m2_jphol_num += 1
-
-            if m3_jphol_len > 0 and m3_jphol_num < m3_jphol_len:
-                if (holiday_jp[m3][m3_jphol_num] == year_dates[m3][idx]):
-                    m3_colour = CLR_YELLOW if m3_colour == CLR_ORANGE else CLR_BLUE
-                    m3_jphol_num += 1
+            if year_dates[m1][idx] in holiday_jp[m1]:
+                m1_colour = CLR_YELLOW if m1_colour == CLR_ORANGE else CLR_BLUE
+            if year_dates[m2][idx] in holiday_jp[m2]:
+                m2_colour = CLR_YELLOW if m2_colour == CLR_ORANGE else CLR_BLUE
+            if year_dates[m3][idx] in holiday_jp[m3]:
+                m3_colour = CLR_YELLOW if m3_colour == CLR_ORANGE else CLR_BLUE
 
             cal_show_background(pygame, display_window, (20 + (0 * 200) + (col_num * block_size_w)), row_height, block_size_w, block_size_h, colours[m1_colour])
             cal_show_background(pygame, display_window, (20 + (1 * 200) + (col_num * block_size_w)), row_height, block_size_w, block_size_h, colours[m2_colour])
@@ -282,13 +235,14 @@ def show_calendar():
     cal_show_message(display_window, font_style, 'Japan',     colours[CLR_BLACK],  label_row_width + 50,  row_height)
     cal_show_message(display_window, font_style, 'Both',      colours[CLR_BLACK],  label_row_width + 100, row_height)
 
+    # nothing animates, so block on events and repaint only when exposed
+    pygame.display.update()
     while cal_display:
-        for event in pygame.event.get():
-            if (event.type == pygame.QUIT) or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
-                cal_display = False
-
-        pygame.display.update()
-        clock.tick(30)
+        event = pygame.event.wait()
+        if (event.type == pygame.QUIT) or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
+            cal_display = False
+        elif event.type == pygame.VIDEOEXPOSE:
+            pygame.display.update()
 
     cal_release(pygame)
 
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
+import calendar
 import datetime
-import tkinter.font as tkfont
 
 # --- Constants ---
 FONT_FAMILY = "Arial"
@@ -51,28 +51,37 @@ class YearCalendar(tk.Tk):
         self.configure(bg=COLORS["empty_bg"])
 
         self.year = year
-        self.holidays_in = holidays_in or {}
-        self.holidays_jp = holidays_jp or {}
+        self.holidays_in = {k: frozenset(v) for k, v in (holidays_in or {}).items()}
+        self.holidays_jp = {k: frozenset(v) for k, v in (holidays_jp or {}).items()}
+        self.holidays_both = {k: self.holidays_in.get(k, frozenset()) & self.holidays_jp.get(k, frozenset())
+                              for k in range(12)}
 
         self.today = datetime.date.today()
 
         # Fonts
-        self.font_default = tkfont.Font(family=FONT_FAMILY, size=FONT_SIZE)
-        self.font_bold = tkfont.Font(family=FONT_FAMILY, size=FONT_SIZE, weight="bold")
+        self.font_default = (FONT_FAMILY, FONT_SIZE)
+        self.font_bold = (FONT_FAMILY, FONT_SIZE, "bold")
 
         # Container frame
         self.calendar_frame = ttk.Frame(self)
         self.calendar_frame.grid(padx=FONT_SIZE // 2, pady=FONT_SIZE // 2)
 
+        # Build and place the window while unmapped so Tk lays it out once
+        self.withdraw()
+        self._legend_frame = None
         self._build_calendar()
+        self._create_legend()
         self._center_window()
+        self.deiconify()
 
     def _build_calendar(self):
-        # Clear frame
+        # Clear frame, keeping the static legend
         for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
+            if widget is not self._legend_frame:
+                widget.destroy()
 
         columns = 4  # 4 columns per row
+        month_cal = calendar.Calendar(firstweekday=6)  # Sunday first
 
         for month_idx in range(12):
             # Month container frame
@@ -81,76 +90,58 @@ class YearCalendar(tk.Tk):
                        padx=FONT_SIZE // 3, pady=FONT_SIZE // 3, sticky="nsew")
 
             # Month name label
-            ttk.Label(frame, text=MONTHS[month_idx], font=self.font_bold).grid(row=0, column=0, columnspan=7, pady=(0, FONT_SIZE // 4))
+            ttk.Label(frame, text=MONTHS[month_idx], font=self.font_bold).grid(row=0, column=0, pady=(0, FONT_SIZE // 4))
+
+            # One canvas holds the weekday header row and up to six weeks
+            canvas = tk.Canvas(frame, width=7 * CIRCLE_DIAMETER, height=7 * CIRCLE_DIAMETER,
+                               highlightthickness=0, bg=COLORS["empty_bg"])
+            canvas.grid(row=1, column=0)
 
             # Days of week header
             for col, day in enumerate(DAYS_OF_WEEK):
-                tk.Label(frame, text=day, font=self.font_default).grid(row=1, column=col)
-
-            # Calculate month start and days
-            first_day = datetime.date(self.year, month_idx + 1, 1)
-            start_index = (first_day.weekday() + 1) % 7  # Sunday=0
-
-            if month_idx == 11:
-                next_month = datetime.date(self.year + 1, 1, 1)
-            else:
-                next_month = datetime.date(self.year, month_idx + 2, 1)
-            days_in_month = (next_month - datetime.timedelta(days=1)).day
-
-            day = 1
-            for week in range(5):  # max 5 weeks
-                for weekday in range(7):
-                    row = week + 2
-                    col = weekday
-
-                    if (week == 0 and weekday < start_index) or day > days_in_month:
-                        self._create_empty_cell(frame, row, col)
-                    else:
-                        self._create_day_cell(frame, month_idx, day, row, col)
-                        day += 1
+                canvas.create_text(*self._cell_center(0, col), text=day, font=self.font_default)
 
-        self._create_legend()
+            # Day 0 is padding outside the month
+            for i, day in enumerate(month_cal.itermonthdays(self.year, month_idx + 1)):
+                if day:
+                    week, weekday = divmod(i, 7)
+                    self._create_day_cell(canvas, month_idx, day, week + 1, weekday)
 
-    def _create_empty_cell(self, parent, row, column):
-        label = tk.Label(parent, text="   ", width=2, relief="flat", font=self.font_default,
-                         bg=COLORS["empty_bg"])
-        label.grid(row=row, column=column)
+    @staticmethod
+    def _cell_center(row, column):
+        half = CIRCLE_DIAMETER // 2
+        return column * CIRCLE_DIAMETER + half, row * CIRCLE_DIAMETER + half
 
-    def _create_day_cell(self, parent, month_idx, day_num, row, column):
+    def _create_day_cell(self, canvas, month_idx, day_num, row, column):
         # Determine colors based on holidays and today
-        in_india = day_num in self.holidays_in.get(month_idx, [])
-        in_japan = day_num in self.holidays_jp.get(month_idx, [])
         is_today = (self.year == self.today.year and (month_idx + 1) == self.today.month and day_num == self.today.day)
 
         if is_today:
             fill = COLORS["today_fill"]
             fg = COLORS["today_fg"]
-        elif in_india and in_japan:
+        elif day_num in self.holidays_both[month_idx]:
             fill = COLORS["both_fill"]
             fg = COLORS["default_fg"]
-        elif in_india:
+        elif day_num in self.holidays_in.get(month_idx, ()):
             fill = COLORS["india_fill"]
             fg = COLORS["default_fg"]
-        elif in_japan:
+        elif day_num in self.holidays_jp.get(month_idx, ()):
             fill = COLORS["japan_fill"]
             fg = COLORS["japan_fg"]
         else:
             fill = None
             fg = COLORS["default_fg"]
 
-        canvas = tk.Canvas(parent, width=CIRCLE_DIAMETER, height=CIRCLE_DIAMETER,
-                           highlightthickness=0, bg=COLORS["empty_bg"])
+        x, y = self._cell_center(row, column)
+        tag = f"d{month_idx}_{day_num}"
         if fill:
             r = CIRCLE_DIAMETER // 2 - 2
-            x = y = CIRCLE_DIAMETER // 2
-            canvas.create_oval(x - r, y - r, x + r, y + r, fill=fill, outline="")
+            canvas.create_oval(x - r, y - r, x + r, y + r, fill=fill, outline="", tags=(tag,))
 
-        canvas.create_text(CIRCLE_DIAMETER // 2, CIRCLE_DIAMETER // 2,
-                           text=str(day_num), fill=fg, font=self.font_default)
-        canvas.grid(row=row, column=column)
+        canvas.create_text(x, y, text=str(day_num), fill=fg, font=self.font_default, tags=(tag,))
 
     def _create_legend(self):
-        legend_frame = ttk.Frame(self.calendar_frame, padding=FONT_SIZE // 3)
+        legend_frame = self._legend_frame = ttk.Frame(self.calendar_frame, padding=FONT_SIZE // 3)
         legend_frame.grid(row=3, column=0, columnspan=4, pady=(FONT_SIZE // 2, FONT_SIZE // 3), sticky="w")
 
         legend_items = [
@@ -168,8 +159,8 @@ class YearCalendar(tk.Tk):
 
     def _center_window(self):
         self.update_idletasks()
-        w = self.winfo_width()
-        h = self.winfo_height()
+        w = self.winfo_reqwidth()
+        h = self.winfo_reqheight()
         screen_w = self.winfo_screenwidth()
         screen_h = self.winfo_screenheight()
         x = (screen_w - w) // 2
@@ -2,17 +2,23 @@ import sys
 import json
 import csv
 import datetime
+import math
+import queue
+import threading
+import time
 from pathlib import Path
 import tkinter as tk
-from tkinter import messagebox, filedialog
 
 CIRCLE_THICKNESS = 4
-SESSION_LOG_FILENAME = "pomozlogs.json"
+SESSION_LOG_FILENAME = "pomozlogs.jsonl"
+LEGACY_SESSION_LOG_FILENAME = "pomozlogs.json"
+LOG_RECORD_KEYS = {"date", "timestamp", "session_type", "duration_seconds"}
 POMODORO_DURATION = 25 * 60
 BREAK_DURATION = 5 * 60
 WINDOW_SIZE = (280, 320)
 CIRCLE_SIZE = 180
 BASE_FONT = ("Arial", 10)
+TIMER_STRINGS = [f"{t // 60:02d}:{t % 60:02d}" for t in range(max(POMODORO_DURATION, BREAK_DURATION) + 1)]
 
 GREY_COLOR = "#d0d0d0"
 BLUE_COLOR = "#1E90FF"
@@ -31,16 +37,40 @@ class SimplePomodoro(tk.Tk):
         self._center_window(*WINDOW_SIZE)
         self.app_folder = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).parent.resolve()
         self.log_file = self.app_folder / SESSION_LOG_FILENAME
-        self.session_log = self._load_session_log()
+        self._session_log_cache = None
+        self._log_fp = None
         self.is_running = False
         self.is_pomodoro = True
         self.time_left = POMODORO_DURATION
         self.timer_id = None
+        self._deadline = None
+        self._remaining = POMODORO_DURATION
+        self._last_timer_text = None
+        self._last_deg = None
+        self._last_session_text = None
+        self._last_status_text = None
+        self._log_warning = None
+        self._beep_queue = queue.Queue(maxsize=1)
+        if winsound:
+            threading.Thread(target=self._beep_worker, daemon=True).start()
         self._build_ui()
         self._update_ui()
         self.bind("<space>", lambda _: self._toggle_timer())
         self.bind("r", lambda _: self._reset_timer())
 
+    def destroy(self):
+        try:
+            if self._log_fp is not None:
+                self._log_fp.close()
+        finally:
+            super().destroy()
+
+    @property
+    def session_log(self):
+        if self._session_log_cache is None:
+            self._session_log_cache = self._load_session_log()
+        return self._session_log_cache
+
     def _center_window(self, width, height):
         sw, sh = self.winfo_screenwidth(), self.winfo_screenheight()
         x, y = (sw - width) // 2, (sh - height) // 2
@@ -53,6 +83,10 @@ class SimplePomodoro(tk.Tk):
         self.canvas = tk.Canvas(self, width=CIRCLE_SIZE, height=CIRCLE_SIZE, bg=BG_COLOR, highlightthickness=0, cursor="hand2")
         self.canvas.pack(pady=5)
         self.canvas.bind("<Button-1>", lambda _: self._toggle_timer())
+        margin = 10
+        self._arc_bbox = (margin, margin, CIRCLE_SIZE - margin, CIRCLE_SIZE - margin)
+        self.canvas.create_oval(*self._arc_bbox, outline=GREY_COLOR, width=CIRCLE_THICKNESS)
+        self.progress_arc = self.canvas.create_arc(*self._arc_bbox, start=90, extent=0, style=tk.ARC, outline=GREY_COLOR, width=CIRCLE_THICKNESS)
         self.timer_text = self.canvas.create_text(CIRCLE_SIZE // 2, CIRCLE_SIZE // 2, text="00:00", font=BASE_FONT, fill=BLUE_COLOR)
         self.status_label = tk.Label(self, font=BASE_FONT, bg=BG_COLOR, fg=FG_COLOR)
         self.status_label.pack(pady=(5, 15))
@@ -66,25 +100,39 @@ class SimplePomodoro(tk.Tk):
         menu_btn.place(relx=1, rely=0, anchor="ne", x=-5, y=5)
 
     def _update_ui(self):
-        self.session_label.config(text="Pomodoro session" if self.is_pomodoro else "Break session")
-        margin = 10
-        x0, y0, x1, y1 = margin, margin, CIRCLE_SIZE - margin, CIRCLE_SIZE - margin
-        self.canvas.delete("progress_arc", "progress_arc_bg")
-        self.canvas.create_oval(x0, y0, x1, y1, outline=GREY_COLOR, width=CIRCLE_THICKNESS, tags="progress_arc_bg")
-        total = self._current_session_duration()
-        elapsed = total - self.time_left
-        extent = (elapsed / total) * 360 if total else 0
-        arc_color = GREY_COLOR if extent < 0.3 else BLUE_COLOR
-        self.canvas.create_arc(x0, y0, x1, y1, start=90, extent=-extent, style=tk.ARC, outline=arc_color, width=CIRCLE_THICKNESS, tags="progress_arc")
-        mins, secs = divmod(self.time_left, 60)
-        self.canvas.itemconfig(self.timer_text, text=f"{mins:02d}:{secs:02d}")
-        if self.is_running:
+        self._update_session_chrome()
+        self._update_arc()
+        self._update_timer_text()
+
+    def _update_session_chrome(self):
+        session_text = "Pomodoro session" if self.is_pomodoro else "Break session"
+        if session_text != self._last_session_text:
+            self._last_session_text = session_text
+            self.session_label.config(text=session_text)
+        if self._log_warning:
+            status = self._log_warning
+        elif self.is_running:
             status = "Click circle to pause"
-        elif self.time_left == total:
+        elif self._remaining == self._current_session_duration():
             status = "Click circle to start"
         else:
             status = "Click circle to resume"
-        self.status_label.config(text=status)
+        if status != self._last_status_text:
+            self._last_status_text = status
+            self.status_label.config(text=status)
+
+    def _update_arc(self):
+        total = self._current_session_duration()
+        deg = (total - self.time_left) * 360 // total if total else 0
+        if deg != self._last_deg:
+            self._last_deg = deg
+            self.canvas.itemconfig(self.progress_arc, extent=-deg, outline=BLUE_COLOR if deg else GREY_COLOR)
+
+    def _update_timer_text(self):
+        timer_text = TIMER_STRINGS[self.time_left]
+        if timer_text != self._last_timer_text:
+            self._last_timer_text = timer_text
+            self.canvas.itemconfig(self.timer_text, text=timer_text)
 
     def _current_session_duration(self):
         return POMODORO_DURATION if self.is_pomodoro else BREAK_DURATION
@@ -95,72 +143,133 @@ class SimplePomodoro(tk.Tk):
     def _start_timer(self):
         if not self.is_running:
             self.is_running = True
+            self._log_warning = None
+            self._deadline = time.monotonic() + self._remaining
             self._count_down()
-            self._update_ui()
+            self._update_session_chrome()
 
     def _pause_timer(self):
         if self.is_running:
             self.is_running = False
+            self._remaining = max(0, self._deadline - time.monotonic())
             if self.timer_id:
                 self.after_cancel(self.timer_id)
                 self.timer_id = None
-            self._update_ui()
+            self._update_session_chrome()
 
     def _reset_timer(self):
         self._pause_timer()
         self.is_pomodoro = True
-        self.time_left = POMODORO_DURATION
+        self.time_left = self._remaining = POMODORO_DURATION
         self._update_ui()
 
     def _count_down(self):
-        if self.is_running and self.time_left > 0:
-            self.time_left -= 1
-            self._update_ui()
-            self.timer_id = self.after(1000, self._count_down)
-        elif self.is_running and self.time_left == 0:
+        if not self.is_running:
+            return
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            self.time_left = 0
             self._session_finished()
+            return
+        time_left = math.ceil(remaining)
+        if time_left != self.time_left:
+            self.time_left = time_left
+            self._update_arc()
+            self._update_timer_text()
+        delay_ms = int((remaining - (time_left - 1)) * 1000) + 1
+        self.timer_id = self.after(delay_ms, self._count_down)
 
     def _session_finished(self):
-        self.is_running = False
         self.timer_id = None
         self._save_session()
         self._play_sound()
-        self._switch_session()
+        next_pomodoro = not self.is_pomodoro
+        next_duration = POMODORO_DURATION if next_pomodoro else BREAK_DURATION
+        self.is_pomodoro, self.time_left, self.is_running = next_pomodoro, next_duration, False
+        self._remaining = next_duration
         self._update_ui()
 
-    def _switch_session(self):
-        self.is_pomodoro = not self.is_pomodoro
-        self.time_left = self._current_session_duration()
-
     def _save_session(self):
-        today = datetime.date.today().isoformat()
-        now = datetime.datetime.now().isoformat(timespec="seconds")
+        now = datetime.datetime.now()
+        today = now.date().isoformat()
         duration = self._current_session_duration()
         session_type = "Pomodoro" if self.is_pomodoro else "Break"
-        self.session_log.setdefault(today, []).append({
-            "timestamp": now,
+        record = {
+            "date": today,
+            "timestamp": now.isoformat(timespec="seconds"),
             "session_type": session_type,
             "duration_seconds": duration,
-        })
-        self._write_session_log()
+        }
+        self.session_log.append(record)
+        self._append_session_log(record)
 
     def _load_session_log(self):
-        if self.log_file.exists():
-            try:
-                with self.log_file.open(encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        return {}
+        session_log = []
+        torn = False
+        try:
+            with self.log_file.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        record = None
+                    if not isinstance(record, dict) or not LOG_RECORD_KEYS <= record.keys():
+                        torn = True
+                        continue
+                    torn = torn or not line.endswith("\n")
+                    session_log.append(record)
+        except FileNotFoundError:
+            return self._migrate_legacy_log()
+        except IOError:
+            return []
+        if torn:  # an append was interrupted; rewrite so the next one starts clean
+            self._write_session_log(session_log)
+        return session_log
+
+    def _migrate_legacy_log(self):
+        legacy_file = self.app_folder / LEGACY_SESSION_LOG_FILENAME
+        try:
+            with legacy_file.open(encoding="utf-8") as f:
+                legacy_log = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return []
+        session_log = [
+            {"date": date, **entry}
+            for date, sessions in sorted(legacy_log.items())
+            for entry in sessions
+        ]
+        self._write_session_log(session_log)
+        return session_log
 
-    def _write_session_log(self):
+    def _append_session_log(self, record):
+        # opened lazily so it never predates the load-time torn-line rewrite
         try:
-            with self.log_file.open("w", encoding="utf-8") as f:
-                json.dump(self.session_log, f, indent=2)
+            if self._log_fp is None:
+                self._log_fp = self.log_file.open("a", encoding="utf-8", buffering=1)
+            self._log_fp.write(self._encode_record(record))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save session log:\n{e}")
+            self._show_log_error(e)
+
+    @staticmethod
+    def _encode_record(record):
+        return json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+    def _write_session_log(self, session_log):
+        tmp_file = self.log_file.with_name(self.log_file.name + ".tmp")
+        try:
+            with tmp_file.open("w", encoding="utf-8") as f:
+                f.writelines(map(self._encode_record, session_log))
+            tmp_file.replace(self.log_file)
+        except Exception as e:
+            self._show_log_error(e)
+
+    def _show_log_error(self, e):
+        print(f"pomoz: failed to save session log: {e}", file=sys.stderr)
+        self._log_warning = "⚠ Session log not saved"
+        self._update_session_chrome()
 
     def _export_log(self):
+        from tkinter import messagebox, filedialog
         if not self.session_log:
             messagebox.showinfo("Export Log", "No session data to export.")
             return
@@ -172,20 +281,31 @@ class SimplePomodoro(tk.Tk):
         if not file_path:
             return
         try:
-            with open(file_path, "w", newline="", encoding="utf-8") as file:
+            with open(file_path, "w", newline="", encoding="utf-8", buffering=1 << 16) as file:
                 writer = csv.writer(file)
                 writer.writerow(["Date", "Timestamp", "Session Type", "Duration (seconds)"])
-                for date, sessions in sorted(self.session_log.items()):
-                    for entry in sessions:
-                        writer.writerow([date, entry["timestamp"], entry["session_type"], entry["duration_seconds"]])
+                writer.writerows(
+                    (record["date"], record["timestamp"], record["session_type"], record["duration_seconds"])
+                    for record in sorted(self.session_log, key=lambda record: record["date"])
+                )
             messagebox.showinfo("Export Log", f"Session log exported successfully to:\n{file_path}")
         except Exception as e:
             messagebox.showerror("Export Log", f"Failed to export log:\n{e}")
 
     def _play_sound(self):
+        # Beep blocks for its whole duration, so hand it to the worker;
+        # a request made while one is still queued is dropped.
         if winsound:
             try:
-                winsound.Beep(500, 1500)
+                self._beep_queue.put_nowait((500, 1500))
+            except queue.Full:
+                pass
+
+    def _beep_worker(self):
+        while True:
+            frequency, duration = self._beep_queue.get()
+            try:
+                winsound.Beep(frequency, duration)
             except RuntimeError:
                 pass
 